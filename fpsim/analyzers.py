@@ -4,6 +4,7 @@ defined by the user by inheriting from these classes.
 '''
 
 import numpy as np
+import pandas as pd
 import sciris as sc
 import pylab as pl
 import matplotlib.pyplot as plt
@@ -139,7 +140,7 @@ class snapshot(Analyzer):
         """
         for t in self.timesteps:
             if np.isclose(sim.i, t):
-                self.snapshots[str(sim.i)] = sc.dcp(sim.people) # Take snapshot!
+                self.snapshots[str(sim.i)] = sim.people.copy_arrays() # Take snapshot!
         return
 
       
@@ -155,7 +156,7 @@ class education_recorder(Analyzer):
 
         def __init__(self, **kwargs):
             super().__init__(**kwargs)   # Initialize the Analyzer object
-            self.snapshots = sc.odict()  # Store the actual snapshots
+            self.snapshots = {}  # Store the actual snapshots
             self.keys = ['edu_objective', 'edu_attainment', 'edu_completed',
                          'edu_dropout', 'edu_interrupted',
                          'pregnant', 'alive', 'age']
@@ -170,10 +171,8 @@ class education_recorder(Analyzer):
             save result at snapshot[str(timestep)]
             """
             females = sim.people.filter(sim.people.is_female)
-            self.snapshots[str(sim.i)] = {}
-            for key in self.keys:
-                self.snapshots[str(sim.i)][key] = sc.dcp(females[key])  # Take snapshot!
-                self.max_agents = max(self.max_agents, len(females))
+            self.max_agents = max(self.max_agents, len(females))
+            self.snapshots[str(sim.i)] = {key: females[key] for key in self.keys}  # Take snapshot! Indexing a filtered People object already returns a copy
             return
 
         def finalize(self, sim=None):
@@ -185,11 +184,12 @@ class education_recorder(Analyzer):
             self.finalized = True
             # Process data so we can plot it easily
             self.time = np.array([key for key in self.snapshots.keys()], dtype=int)
+            snaps = list(self.snapshots.values())
+            lengths = np.array([len(snap[self.keys[0]]) for snap in snaps])
+            filled = np.arange(self.max_agents) < lengths[:, None]  # Which entries of each row have data; the rest stay NaN
             for state in self.keys:
                 self.trajectories[state] = np.full((len(self.time), self.max_agents), np.nan)
-                for ti, t in enumerate(self.time):
-                    stop_idx = len(self.snapshots[t][state])
-                    self.trajectories[state][ti, 0:stop_idx] = self.snapshots[t][state]
+                self.trajectories[state][filled] = np.concatenate([snap[state] for snap in snaps])  # Fills row by row
             return
 
         def plot(self, index=0, fig_args=None, pl_args=None):
@@ -267,10 +267,7 @@ class education_recorder(Analyzer):
             data_obj = self.trajectories["edu_objective"]
             data_age = self.trajectories["age"]
 
-            mask = (data_age < min_age) | (data_age > max_age) | np.isnan(data_age)
-
-            data_att = np.ma.array(data_att, mask=mask)
-            data_obj = np.ma.array(data_obj, mask=mask)
+            valid = (data_age >= min_age) & (data_age <= max_age) # Also excludes NaN entries, i.e. agents not yet born
 
             n_tpts = data_att.shape[0]
             if n_tpts <= max_timepoints:
@@ -299,12 +296,10 @@ class education_recorder(Analyzer):
 
             # Loop through the selected time points and create kernel density estimates
             for idx, ti in enumerate(tpts_to_plot):
-                data_att_ti = np.sort(data_att[ti, :][~data_att[ti, :].mask].data)
-                data_obj_ti = np.sort(data_obj[ti, :][~data_obj[ti, :].mask].data)
-
+                valid_ti = valid[ti, :]
                 try:
-                    kde_att = gaussian_kde(data_att_ti)
-                    kde_obj = gaussian_kde(data_obj_ti)
+                    kde_att = gaussian_kde(data_att[ti, valid_ti])
+                    kde_obj = gaussian_kde(data_obj[ti, valid_ti])
 
                     y_att = kde_att(edu_years)
                     y_obj = kde_obj(edu_years)
@@ -355,8 +350,9 @@ class empowerment_recorder(Analyzer):
         """
         super().__init__()
         self.bins = bins
-        self.data = sc.objdict()
+        self.data = {}
         self.keys = ['partnered', 'urban', 'paid_employment', 'decision_wages', 'decision_health', 'sexual_autonomy', 'age']
+        self.prop_keys = ['partnered', 'urban', 'paid_employment'] # Boolean attributes, recorded as proportions
         self.nbins = None
         return
 
@@ -367,6 +363,7 @@ class empowerment_recorder(Analyzer):
         super().initialize()
         if self.bins is None:
             self.bins = np.arange(0, sim.pars['max_age']+2)
+        self.bins = np.ascontiguousarray(self.bins)
         self.nbins = len(self.bins)-1
 
         for key in self.keys:
@@ -377,22 +374,33 @@ class empowerment_recorder(Analyzer):
         """
         Records histogram of empowerment attribute of all **alive female** individuals
         """
-        # Alive and female
-        living_females = sc.findinds(sim.people.alive, sim.people.is_female)
-        ages = sim.people.age[living_females]
-        age_group = np.digitize(ages, self.bins) - 1
+        ppl = sim.people
 
-        for key in self.keys:
-            data = sim.people[key][living_females]
-            if key == 'age':
-                # Count how many living females we have in this age group
-                temp = np.histogram(ages, self.bins)[0]
-                vals = temp / temp.sum()  # Transform to density
-            elif key in ['partnered', 'urban', 'paid_employment']:
-                vals = [np.mean(data[age_group == group_idx]) for group_idx in range(1, len(self.bins))]
-            else:  # assume float
-                vals = [np.median(data[age_group == group_idx]) for group_idx in range(1, len(self.bins))]
-            self.data[key][:, sim.i] = vals
+        # Alive and female
+        living_females = ppl.alive & ppl.is_female
+        ages = ppl.age[living_females]
+        age_group = np.searchsorted(self.bins, ages, side='right') - 1 # Equivalent to np.digitize for sorted bins, but faster
+        in_bins = (age_group >= 0) & (age_group < self.nbins) # Ignore anyone outside the bins
+        age_group = age_group[in_bins]
+        selected = living_females.copy() # Living females within the bins, so each attribute needs a single gather
+        selected[living_females] = in_bins
+
+        # Group once by age, then take proportions of the boolean attributes and medians of the float attributes
+        prop_keys   = [key for key in self.keys if key in self.prop_keys]
+        median_keys = [key for key in self.keys if key not in self.prop_keys and key != 'age']
+        df = pd.DataFrame({key: ppl[key][selected].astype(float) for key in prop_keys + median_keys})
+        grouped = df.groupby(age_group)
+        bins = np.arange(self.nbins)
+        for stats in [grouped[prop_keys].mean(), grouped[median_keys].median()]:
+            stats = stats.reindex(bins) # Groups with no one in them are NaN
+            for key in stats.columns:
+                self.data[key][:, sim.i] = stats[key].to_numpy()
+
+        if 'age' in self.keys:
+            # Count how many living females we have in this age group
+            temp = np.histogram(ages, self.bins)[0]
+            self.data['age'][:, sim.i] = temp / temp.sum()  # Transform to density
+        return
 
     def plot(self, to_plot=None, fig_args=None, pl_args=None):
         """
@@ -412,9 +420,9 @@ class empowerment_recorder(Analyzer):
         for k, key in enumerate(to_plot):
             axs.append(fig.add_subplot(rows, cols, k+1))
             try:
-                data = np.array(self.data[key], dtype=float)
+                data = self.data[key] # Already a float array, so no copy is needed
                 label = f'metric: {key}'
-                if key in ['partnered', 'urban', 'paid_employment']:
+                if key in self.prop_keys:
                     clabel = f"proportion of {key}"
                     cmap = 'RdPu'
                     vmin, vmax = 0, 1
@@ -423,7 +431,7 @@ class empowerment_recorder(Analyzer):
                 elif key in ['age']:
                     clabel = "proportion of agents"
                     cmap = 'Blues'
-                    vmin, vmax = 0, np.nanmax(data[:])
+                    vmin, vmax = 0, np.nanmax(data)
                 else:
                     clabel = "average (median)"
                     cmap = 'coolwarm'
@@ -477,6 +485,7 @@ class age_pyramids(Analyzer):
         """
         super().__init__()
         self.bins = bins
+        self.nbins = None
         self.data = None
         return
 
@@ -487,8 +496,10 @@ class age_pyramids(Analyzer):
         super().initialize()
         if self.bins is None:
             self.bins = np.arange(0, sim.pars['max_age']+2)
-        nbins = len(self.bins)-1
-        self.data = np.full((sim.npts, nbins), np.nan)
+        self.bins = np.asarray(self.bins)
+        self.nbins = len(self.bins)-1
+        self._unit_bins = np.all(np.diff(self.bins) == 1) # e.g. the default one-year bins, which can be counted with np.bincount
+        self.data = np.full((sim.npts, self.nbins), np.nan)
         self._raw = sc.dcp(self.data)
         return
 
@@ -497,9 +508,16 @@ class age_pyramids(Analyzer):
         Records histogram of ages of all alive individuals at a timestep such that
         self.data[timestep] = list of proportions where index signifies age
         """
-        ages = sim.people.age[sc.findinds(sim.people.alive)]
-        self._raw[sim.i, :] = np.histogram(ages, self.bins)[0]
-        self.data[sim.i, :] = self._raw[sim.i, :]/self._raw[sim.i, :].sum()
+        ages = sim.people.age[sim.people.alive]
+        if self._unit_bins:
+            in_range = (ages >= self.bins[0]) & (ages <= self.bins[-1])
+            inds = (ages[in_range] - self.bins[0]).astype(np.int64) # Truncation is the floor here, since the values are non-negative
+            np.minimum(inds, self.nbins-1, out=inds) # As in np.histogram, the last bin includes its right edge
+            counts = np.bincount(inds, minlength=self.nbins)
+        else:
+            counts = np.histogram(ages, self.bins)[0]
+        self._raw[sim.i, :] = counts
+        self.data[sim.i, :] = counts/counts.sum()
 
     def plot(self):
         """
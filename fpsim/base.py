@@ -170,19 +170,19 @@ class BasePeople(sc.prettyobj):
                 keys = obj_get(self, '_keys')
             except:
                 keys = []
-            if attr not in keys:
-                return output
-            else:
-                if self._is_filtered(attr):
-                    output = output[self.inds]
+            if attr in keys: # Check the keys and indices directly, rather than dispatching through _is_filtered() and inds
+                inds = obj_get(self, '_inds')
+                if inds is not None:
+                    output = output[inds]
         return output
 
 
     def __setattr__(self, attr, value):
         ''' Ditto '''
-        if self._is_filtered(attr):
+        inds = obj_get(self, '_inds')
+        if inds is not None and attr in obj_get(self, '_keys'):
             array = obj_get(self, attr)
-            array[self.inds] = value
+            array[inds] = value
         else:   # If not initialized, rely on the default behavior
             obj_set(self, attr, value)
         return
@@ -229,6 +229,30 @@ class BasePeople(sc.prettyobj):
             keys = []
         return keys
 
+
+    def copy_arrays(self):
+        '''
+        Returns a shallow copy of the people object in which the state arrays
+        (and per-person lists) are copied, so the copy captures the current
+        state without deep-copying parameters and other containers.
+
+        Attributes that are not states, such as pars and step_results, are shared
+        with the original rather than copied, so they should be treated as read-only.
+        '''
+        newpeople = sc.cp(self)
+        for key in self.keys():
+            try:
+                val = obj_get(self, key)
+            except AttributeError: # States can be removed, e.g. mothers at the end of a run
+                continue
+            if isinstance(val, np.ndarray):
+                val = val.copy()
+            elif isinstance(val, list):
+                val = [list(v) if isinstance(v, list) else v for v in val]
+            obj_set(newpeople, key, val)
+        obj_set(newpeople, '_keys', self.keys())
+        return newpeople
+
     @property
     def is_female(self):
         ''' Boolean array of everyone female '''
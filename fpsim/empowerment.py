@@ -137,7 +137,7 @@ def get_empowerment_init_vals(ppl):
 
     # Create age bins because ppol.age is a continous variable
     age_cutoffs = np.hstack((empowerment_dict['age'], empowerment_dict['age'].max() + 1))
-    age_inds = np.digitize(f_ages, age_cutoffs) - 1
+    age_inds = np.searchsorted(age_cutoffs, f_ages, 'right') - 1
 
     # Paid employment
     paid_employment_probs = empowerment_dict['paid_employment']
@@ -6,6 +6,7 @@ defined by the user by inheriting from these classes.
 import pylab as pl
 import sciris as sc
 import inspect
+from . import defaults as fpd
 
 
 #%% Generic intervention classes
@@ -274,7 +275,7 @@ class change_par(Intervention):
         if len(self.inds) > self.counter:
             ind = self.inds[self.counter] # Find the current index
             if sim.i == ind: # Check if the current timestep matches
-                curr_val = sc.dcp(sim[self.par])
+                curr_val = sim[self.par] # The parameter is replaced rather than modified, so no copy is needed
                 val = self.vals[self.counter]
                 if val == 'reset':
                     val = self.orig_val
@@ -341,93 +342,145 @@ class update_methods(Intervention):
             raise ValueError(errormsg)
 
         self.applied = False
+        self.probs_plan = self.make_probs_plan()
 
         return
 
 
-    def apply(self, sim):
+    def make_probs_plan(self):
         """
-        Applies the efficacy or contraceptive uptake changes if it is the specified year
-        based on scenario specifications.
+        Parse and validate the method mix shifts. The user-supplied entries are
+        only read, never modified, and the result is frozen as a tuple of
+        (matrix, ages, source, dest, factor, value, copy_from) tuples.
         """
+        valid_keys = ['matrix', 'ages', 'source', 'dest', 'method', 'factor', 'value',
+                      'init_factor', 'discont_factor', 'init_value', 'discont_value', 'copy_from']
+        plan = []
+        if self.probs is not None:
+            for entry in sc.tolist(self.probs):
+                matrix    = entry.get('matrix', self.matrix) # Switching matrix
+                ages      = entry.get('ages')
+                source    = entry.get('source')
+                dest      = entry.get('dest')
+                method    = entry.get('method')
+                factor    = entry.get('factor')
+                value     = entry.get('value')
+                i_factor  = entry.get('init_factor')
+                d_factor  = entry.get('discont_factor')
+                i_value   = entry.get('init_value')
+                d_value   = entry.get('discont_value')
+                copy_from = entry.get('copy_from')
+
+                # Supply default matrix
+                if matrix is None:
+                    matrix = 'annual'
+
+                # Validation
+                invalid = [k for k in entry.keys() if k not in valid_keys]
+                if len(invalid) != 0:
+                    errormsg = f'Keys "{sc.strjoin(invalid)}" not valid entries; see fp.make_scen() for valid args'
+                    raise ValueError(errormsg)
 
-        if not self.applied and sim.y >= self.year:
-            self.applied = True # Ensure we don't apply this more than once
-
-            # Implement efficacy
-            if self.eff is not None:
-                for k,rawval in self.eff.items():
-                    sim.pars.update_method_eff(method=k, eff=rawval)
-
-            # Implement method mix shift
-            if self.probs is not None:
-                probs = sc.tolist(self.probs)
-                for entry in probs:
-                    entry = sc.dcp(entry)
-                    matrix    = entry.pop('matrix', self.matrix) # Switching matrix
-                    ages      = entry.pop('ages', None)
-                    source    = entry.pop('source', None)
-                    dest      = entry.pop('dest', None)
-                    method    = entry.pop('method', None)
-                    factor    = entry.pop('factor', None)
-                    value     = entry.pop('value', None)
-                    i_factor  = entry.pop('init_factor', None)
-                    d_factor  = entry.pop('discont_factor', None)
-                    i_value   = entry.pop('init_value', None)
-                    d_value   = entry.pop('discont_value', None)
-                    copy_from = entry.pop('copy_from', None)
-
-                    # Supply default matrix
-                    if matrix is None:
-                        matrix = 'annual'
-
-                    # Validation # CK: TODO: move validation to initialization
-                    if len(entry) != 0:
-                        errormsg = f'Keys "{sc.strjoin(entry.keys())}" not valid entries; see fp.make_scen() for valid args'
+                # Validate method/source/dest
+                if method is not None:
+                    if (source is not None or dest is not None):
+                        errormsg = 'You can supply "method" as an alternative to "source" and "dest", but not both'
                         raise ValueError(errormsg)
+                    else:
+                        source = method
+                        dest = method
 
-                    # Validate method/source/dest
-                    if method is not None:
-                        if (source is not None or dest is not None):
-                            errormsg = 'You can supply "method" as an alternative to "source" and "dest", but not both'
-                            raise ValueError(errormsg)
-                        else:
-                            source = method
-                            dest = method
+                # Ensure correct number of inputs are given
+                n_vals = len(sc.mergelists(copy_from, factor, value, i_factor, d_factor, i_value, d_value))
+                if n_vals != 1:
+                    errormsg = f'Must supply one and only one of copy_from, factor, value, or initiation/discontinuation factors/values; you supplied {n_vals}'
+                    raise ValueError(errormsg)
 
-                    # Ensure correct number of inputs are given
-                    n_vals = len(sc.mergelists(copy_from, factor, value, i_factor, d_factor, i_value, d_value))
-                    if n_vals != 1:
-                        errormsg = f'Must supply one and only one of copy_from, factor, value, or initiation/discontinuation factors/values; you supplied {n_vals}'
-                        raise ValueError(errormsg)
+                # Check nothing strange has happened
+                is_switch  = len(sc.mergelists(factor, value))
+                is_init    = len(sc.mergelists(i_value, i_factor))
+                is_discont = len(sc.mergelists(d_value, d_factor))
+                is_copy    = (copy_from is not None)
+                if is_switch + is_init + is_discont + is_copy != 1:
+                    errormsg = f'Could not figure out what to do: switching={is_switch}, initiation={is_init}, discontinuation={is_discont}, but only one should happen'
+                    raise ValueError(errormsg)
 
-                    # Check nothing strange has happened
-                    is_switch  = len(sc.mergelists(factor, value))
-                    is_init    = len(sc.mergelists(i_value, i_factor))
-                    is_discont = len(sc.mergelists(d_value, d_factor))
-                    is_copy    = (copy_from is not None)
-                    if is_switch + is_init + is_discont + is_copy != 1:
-                        errormsg = f'Could not figure out what to do: switching={is_switch}, initiation={is_init}, discontinuation={is_discont}, but only one should happen'
-                        raise ValueError(errormsg)
+                if is_init: # It's initiation
+                    source = 'None'
+                    dest = method
+                elif is_discont: # It's discontinuation
+                    source = method
+                    dest = 'None'
+                elif not is_copy and (source is None) and (dest is None):
+                    errormsg = 'Must supply a source or a destination'
+                    raise ValueError(errormsg)
 
-                    if is_init: # It's initiation
-                        source = 'None'
-                        dest = method
-                    elif is_discont: # It's discontinuation
-                        source = method
-                        dest = 'None'
-                    elif not is_copy and (source is None) and (dest is None):
-                        errormsg = 'Must supply a source or a destination'
-                        raise ValueError(errormsg)
+                # Decide if it's a factor or a value modification
+                factor = sc.mergelists(factor, i_factor, d_factor)
+                value  = sc.mergelists(value, i_value, d_value)
+                factor = factor[0] if factor else None
+                value  = value[0]  if value  else None
+
+                # Use None to represent all ages
+                ages = None if ages in fpd.none_all_keys else tuple(sc.tolist(ages))
+                plan.append((matrix, ages, source, dest, factor, value, copy_from))
+
+        return tuple(plan)
 
-                    # Decide if it's a factor or a value modification
-                    factor = sc.mergelists(factor, i_factor, d_factor)
-                    value  = sc.mergelists(value, i_value, d_value)
-                    factor = factor[0] if factor else None
-                    value  = value[0]  if value  else None
 
-                    # Actually update the values and check the matrix is valid
-                    kw = dict(source=source, dest=dest, factor=factor, value=value, ages=ages, matrix=matrix, copy_from=copy_from)
-                    sim.pars.update_method_prob(**kw)
+    def initialize(self, sim):
+        """
+        Resolve method names and age keys to indices once, so that applying the
+        changes only requires a lookup.
+        """
+        super().initialize()
+        pars = sim.pars
+
+        # Resolve efficacy keys
+        self.eff_updates = {}
+        if self.eff is not None:
+            for k,rawval in self.eff.items():
+                self.eff_updates[pars._as_key(k)] = rawval
+
+        # Lookup table from method names to indices; anything else (e.g. ints, invalid keys) is handled by the pars
+        kmap = {**pars['methods']['map'], 'all': slice(None), ':': slice(None)}
+        def to_ind(key):
+            ind = kmap.get(key) if isinstance(key, str) else None
+            return ind if ind is not None else pars._as_ind(key, allow_none=False)
+
+        # Resolve the method mix shifts
+        self.prob_updates = []
+        for matrix, ages, source, dest, factor, value, copy_from in self.probs_plan:
+            if copy_from is not None:
+                copy_from = to_ind(copy_from)
+                if source is None: # We need a source, but it's not always used
+                    source = copy_from
+            source = to_ind(source)
+            dest   = to_ind(dest)
+            ages = list(pars['methods']['raw']['annual'].keys()) if ages is None else list(ages)
+
+            kw = dict(source=source, dest=dest, factor=factor, value=value, ages=ages, matrix=matrix, copy_from=copy_from)
+            self.prob_updates.append(kw)
 
-        return
\ No newline at end of file
+        return
+
+
+    def apply(self, sim):
+        """
+        Applies the efficacy or contraceptive uptake changes if it is the specified year
+        based on scenario specifications.
+        """
+        if self.applied or sim.y < self.year:
+            return
+
+        self.applied = True # Ensure we don't apply this more than once
+
+        # Implement efficacy
+        for k,rawval in self.eff_updates.items():
+            sim.pars.update_method_eff(method=k, eff=rawval)
+
+        # Implement method mix shift, updating the values and checking the matrix is valid
+        for kw in self.prob_updates:
+            sim.pars.update_method_prob(**kw)
+
+        return
@@ -167,7 +167,6 @@ class Pars(dict):
         '''
 
         mapping = self['methods']['map']
-        keys = list(mapping.keys())
 
         # Validation
         if key is None and not allow_none:
@@ -185,11 +184,14 @@ class Pars(dict):
                 raise sc.KeyNotFoundError(errormsg) from E
         elif isinstance(key, int):  # Already an int, do nothing
             ind = key
+            keys = list(mapping.keys())
             if ind < len(keys):
                 key = keys[ind]
             else:
                 errormsg = f'Method index {ind} is out of bounds for methods {sc.strjoin(keys)}'
                 raise IndexError(errormsg)
+        elif isinstance(key, slice):  # Already resolved from one of the "all" keys
+            ind = key
         else:
             errormsg = f'Could not process key of type {type(key)}: must be str or int'
             raise TypeError(errormsg)
@@ -271,7 +273,7 @@ class Pars(dict):
         raw = self['methods']['raw']  # We adjust the raw matrices, so the effects are persistent
 
         # Convert from strings to indices
-        if copy_from:
+        if copy_from is not None:
             copy_from = self._as_ind(copy_from, allow_none=False)
             if source is None:  # We need a source, but it's not always used
                 source = copy_from
@@ -609,6 +611,34 @@ default_pars = {
 # Shortcut for accessing default keys
 par_keys = default_pars.keys()
 
+# Location parameters already constructed by make_pars(), keyed by location and options
+_location_pars_cache = {}
+
+
+def location_pars(location, **loc_kwargs):
+    '''
+    Return a fresh copy of the parameters for a location, only calling the
+    location's make_pars() function the first time a set of options is used.
+    Parameters built with empowerment depend on the seed, so they are not cached.
+
+    Args:
+        location (str): the location module name, e.g. 'senegal'
+        loc_kwargs (dict): passed to make_pars()
+    '''
+    from . import locations as fplocs # Here to avoid circular import
+
+    # With empowerment, the parameters depend on the seed, so caching them would keep a copy per seed
+    if loc_kwargs.get('use_empowerment'):
+        return getattr(fplocs, location).make_pars(**loc_kwargs)
+
+    # Otherwise the seed is unused, so don't make separate copies for each seed
+    key_kwargs = {k:v for k,v in loc_kwargs.items() if k != 'seed'}
+    key = (location, tuple(sorted(key_kwargs.items())))
+
+    if key not in _location_pars_cache:
+        _location_pars_cache[key] = getattr(fplocs, location).make_pars(**loc_kwargs)
+    return sc.dcp(_location_pars_cache[key]) # Copy since sims modify their parameters
+
 
 def pars(location=None, validate=True, die=True, update=True, **kwargs):
     '''
@@ -624,8 +654,6 @@ def pars(location=None, validate=True, die=True, update=True, **kwargs):
     **Example**::
         pars = fp.pars(location='senegal')
     '''
-    from . import locations as fplocs # Here to avoid circular import
-
     if not location:
         location = 'default'
 
@@ -650,11 +678,11 @@ def pars(location=None, validate=True, die=True, update=True, **kwargs):
 
    # Define valid locations
     if location in ['senegal', 'default']:
-        pars = sc.mergedicts(pars, fplocs.senegal.make_pars(**loc_kwargs))
+        pars = sc.mergedicts(pars, location_pars('senegal', **loc_kwargs))
     elif location == 'kenya':
-        pars = sc.mergedicts(pars, fplocs.kenya.make_pars(**loc_kwargs))
+        pars = sc.mergedicts(pars, location_pars('kenya', **loc_kwargs))
     elif location == 'ethiopia':
-        pars = sc.mergedicts(pars, fplocs.ethiopia.make_pars(**loc_kwargs))
+        pars = sc.mergedicts(pars, location_pars('ethiopia', **loc_kwargs))
     # Else, error
     else:
         errormsg = f'Location "{location}" is not currently supported'
@@ -140,45 +140,83 @@ class People(fpb.BasePeople):
         Transition probabilities are for 1 year and only for women who have not given birth within the last 6 months.
         """
         methods = self.pars['methods']
-        method_map = methods['map']
-        annual = methods['adjusted']['annual']
-        orig_methods = self.method
-        m = len(method_map)
-        switching_events = np.zeros((m, m), dtype=int)
-        switching_events_ages = {}
-        for key in fpd.method_age_map.keys():
-            switching_events_ages[key] = np.zeros((m, m), dtype=int)
-
-        # Method switching depends both on agent age and also on their current method, so we need to loop over both
-        for key, (age_low, age_high) in fpd.method_age_map.items():
-            match_low_high = fpu.match_ages(self.age, age_low, age_high)
-            for m in method_map.values():
-                match_m = (orig_methods == m)
-                match = match_m * match_low_high
-                this_method = self.filter(match)
-                if len(this_method):
-                    old_method = this_method.method.copy()
-
-                    matrix = annual[key]
-                    choices = matrix[m]
-                    choices = choices/choices.sum()
-                    new_methods = fpu.n_multinomial(choices, match.sum())
-                    this_method.method = new_methods
-
-                    for i in range(len(old_method)):
-                        x = old_method[i]
-                        y = new_methods[i]
-                        switching_events[x, y] += 1
-                        switching_events_ages[key][x, y] += 1
+        annual = methods['stacked']['annual']
+
+        # Method switching depends both on agent age and also on their current method
+        age_group = self.method_age_groups()
+        switching_events_ages = self.switch_methods(age_group >= 0, age_group, annual, normalize=True)
 
         if self.pars['track_switching']:
-            self.step_results_switching[
+            switching_events = sum(switching_events_ages.values())  # Each event is counted in exactly one age group
+            self.step_results['switching'][
                 'annual'] += switching_events  # CK: TODO: remove this extra result and combine with step_results
             for key in fpd.method_age_map.keys():
                 self.step_results['switching_annual'][key] += switching_events_ages[key]
 
         return
 
+    def method_age_groups(self):
+        """
+        Return each agent's index into fpd.method_age_map, or -1 if outside all
+        of the bins. The bins are contiguous, so a single sorted search replaces
+        matching each bin separately.
+        """
+        age_bins = list(fpd.method_age_map.values())
+        edges = np.array([age_low for age_low, _ in age_bins] + [age_bins[-1][1]])
+        age_group = np.searchsorted(edges, self.age, side='right') - 1
+        age_group[age_group == len(age_bins)] = -1 # Older than the last bin
+        return age_group
+
+    def switch_methods(self, eligible, age_group, matrices, rows=None, normalize=False):
+        """
+        Draw a new method for each eligible agent from a row of her age group's switching matrix
+        (by default, the row for her current method), and assign it.
+
+        Agents are sorted by age group and then by row, and all of them are then sampled in a
+        single compiled call, in the same order as looping over the groups.
+
+        Args:
+            eligible (bool array): which agents may switch
+            age_group (int array): each agent's index into fpd.method_age_map
+            matrices (array): the switching matrices, stacked by age group
+            rows (int array): which row of the matrix each agent draws from (default: her current method)
+            normalize (bool): whether to normalize each row before drawing
+
+        Returns:
+            Dictionary of method switching counts by age group (only populated if tracking switching)
+        """
+        orig_methods = self.method
+        n_methods = len(self.pars['methods']['map'])
+        if rows is None:
+            rows = orig_methods
+        n_rows = matrices.shape[1]
+        inds = sc.findinds(eligible)
+        groups = age_group[inds]*n_rows + rows[inds]
+        order = np.argsort(groups, kind='stable')  # Stable, so agents stay in index order within each group
+        inds = inds[order]
+        groups = groups[order]
+
+        group_ids, group_rows = np.unique(groups, return_inverse=True)
+        probs = matrices[group_ids // n_rows, group_ids % n_rows] # One row of probabilities per group
+        if normalize:
+            probs = probs/probs.sum(axis=1, keepdims=True)
+        cdfs = np.cumsum(probs, axis=1)
+        new_methods = fpu.n_multinomial_rows(cdfs, group_rows.astype(np.int64)) # The kernel is compiled for int64 rows, which np.unique() need not return
+
+        methods = orig_methods.copy()
+        methods[inds] = new_methods
+        self.method = methods
+
+        switching_events_ages = {}
+        if self.pars['track_switching']:
+            old_methods = orig_methods[inds].astype(np.int64) # The kernel is compiled for int64, which the int states need not be on every platform
+            for a, key in enumerate(fpd.method_age_map.keys()):
+                in_group = (groups // n_rows) == a
+                switching_events_ages[key] = np.zeros((n_methods, n_methods), dtype=np.int64)
+                fpu.count_transitions(switching_events_ages[key], old_methods[in_group], new_methods[in_group])
+
+        return switching_events_ages
+
     def update_method_pp(self):
         """
         Utilizes data from birth to allow agent to initiate a method postpartum coming from birth by
@@ -191,79 +229,36 @@ class People(fpb.BasePeople):
         # Transitional probabilities are for the first 3 month time period after delivery from DHS data
 
         methods = self.pars['methods']
-        pp0to1 = methods['adjusted']['pp0to1']
-        pp1to6 = methods['adjusted']['pp1to6']
-        methods_map = methods['map']
-        orig_methods = self.method
-
-        m = len(methods_map)
-        switching_events = np.zeros((m, m), dtype=int)
-        switching_events_ages = {}
-        for key in fpd.method_age_map.keys():
-            switching_events_ages[key] = np.zeros((m, m), dtype=int)
+        pp0to1 = methods['stacked']['pp0to1']
+        pp1to6 = methods['stacked']['pp1to6']
 
-        postpartum1 = (self.postpartum_dur == 0)
-        postpartum6 = (self.postpartum_dur == 6)
+        postpartum1 = self.postpartum & (self.postpartum_dur == 0)
+        postpartum6 = self.postpartum & (self.postpartum_dur == 6)
+        age_group = self.method_age_groups()
 
         # In first time step after delivery, choice is by age but not previous method (since just gave birth)
         # All women are coming from birth and on no method to start, either will stay on no method or initiate a method
-        for key, (age_low, age_high) in fpd.method_age_map.items():
-            match_low_high = fpu.match_ages(self.age, age_low, age_high)
-            low_parity = (self.parity < self.pars['high_parity'])
-            high_parity = (self.parity >= self.pars['high_parity'])
-            match = (self.postpartum * postpartum1 * match_low_high * low_parity)
-            match_high_parity = (self.postpartum * postpartum1 * match_low_high * high_parity)
-            this_method = self.filter(match)
-            if len(this_method):
-                this_method_high_parity = self.filter(match_high_parity)
-                old_method = this_method.method.copy()
-                old_method_high_parity = sc.dcp(this_method_high_parity.method)
-
-                choices = pp0to1[key]
-                choices_high_parity = sc.dcp(choices)
-                choices_high_parity[0] *= self.pars['high_parity_nonuse']
-                choices_high_parity = choices_high_parity / choices_high_parity.sum()
-                new_methods = fpu.n_multinomial(choices, len(this_method))
-                new_methods_high_parity = fpu.n_multinomial(choices_high_parity, len(this_method_high_parity))
-                this_method.method = np.array(new_methods, dtype=np.int64)
-                this_method_high_parity.method = np.array(new_methods_high_parity, dtype=np.int64)
-                for i in range(len(old_method)):
-                    x = old_method[i]
-                    y = new_methods[i]
-                    switching_events[x, y] += 1
-                    switching_events_ages[key][x, y] += 1
-
-                for i in range(len(old_method_high_parity)):
-                    x = old_method_high_parity[i]
-                    y = new_methods_high_parity[i]
-                    switching_events[x, y] += 1
-                    switching_events_ages[key][x, y] += 1
+        # Each age group has two rows of choices: the first for low parity, the second for high parity
+        choices_high_parity = pp0to1.copy()
+        choices_high_parity[:, 0] *= self.pars['high_parity_nonuse']
+        choices_high_parity /= choices_high_parity.sum(axis=1, keepdims=True)
+        matrices = np.stack([pp0to1, choices_high_parity], axis=1)
+        high_parity = (self.parity >= self.pars['high_parity']).astype(np.int64)
+        eligible = postpartum1 & (age_group >= 0)
+        has_low_parity = np.bincount(age_group[eligible & (high_parity == 0)], minlength=len(matrices)) > 0
+        eligible &= (high_parity == 0) | has_low_parity[age_group] # High-parity women are only updated in age groups that also have low-parity women
+        switching_events_ages = self.switch_methods(eligible, age_group, matrices, rows=high_parity)
 
         # At 6 months, choice is by previous method and by age
         # Allow initiation, switching, or discontinuing with matrix at 6 months postpartum
         # Transitional probabilities are for 5 months, 1-6 months after delivery from DHS data
-        for key, (age_low, age_high) in fpd.method_age_map.items():
-            match_low_high = fpu.match_ages(self.age, age_low, age_high)
-            match_postpartum_age = self.postpartum * postpartum6 * match_low_high
-            for m in methods_map.values():
-                match_m = (orig_methods == m)
-                match = match_m * match_postpartum_age
-                this_method = self.filter(match)
-                if len(this_method):
-                    old_method = self.method[match].copy()
-
-                    matrix = pp1to6[key]
-                    choices = matrix[m]
-                    new_methods = fpu.n_multinomial(choices, match.sum())
-                    this_method.method = new_methods
-                    for i in range(len(old_method)):
-                        x = old_method[i]
-                        y = new_methods[i]
-                        switching_events[x, y] += 1
-                        switching_events_ages[key][x, y] += 1
+        switching_events_pp6 = self.switch_methods(postpartum6 & (age_group >= 0), age_group, pp1to6)
+        for key, counts in switching_events_pp6.items():
+            switching_events_ages[key] += counts
 
         if self.pars['track_switching']:
-            self.step_results_switching['postpartum'] += switching_events
+            switching_events = sum(switching_events_ages.values())  # Each event is counted in exactly one age group
+            self.step_results['switching']['postpartum'] += switching_events
             for key in fpd.method_age_map.keys():
                 self.step_results['switching_postpartum'][key] += switching_events_ages[key]
 
@@ -567,7 +562,8 @@ class People(fpb.BasePeople):
         """
         death_prob = (self.pars['mortality_probs']['infant'])
         if len(self) > 0:
-            age_inds = sc.findnearest(self.pars['infant_mortality']['ages'], self.age)
+            ages = self.pars['infant_mortality']['ages']
+            age_inds = np.abs(self.age[:, None] - ages).argmin(axis=1) # Nearest table age for each mother, as with sc.findnearest()
             death_prob = death_prob * (self.pars['infant_mortality']['age_probs'][age_inds])
         is_death = self.binomial(death_prob)
         death = self.filter(is_death)
@@ -699,23 +695,15 @@ class People(fpb.BasePeople):
                     self.step_results[key] = live_births_age_split[key]
 
             # TEMP -- update children, need to refactor
-            r = sc.dictobj(**self.step_results)
-            new_people = r.births - r.infant_deaths  # Do not add agents who died before age 1 to population
-            children_map = sc.ddict(int)
-            for i in live.inds:
-                children_map[i] += 1
-            for i in twin.inds:
-                children_map[i] += 1
-            for i in i_death.inds:
-                children_map[i] -= 1
-
-            assert sum(list(children_map.values())) == new_people
-            start_ind = len(all_ppl)
-            for mother, n_children in children_map.items():
-                end_ind = start_ind + n_children
-                children = list(range(start_ind, end_ind))
-                all_ppl.children[mother] += children
-                start_ind = end_ind
+            new_people = self.step_results['births'] - self.step_results['infant_deaths']  # Do not add agents who died before age 1 to population
+            mothers = live.inds
+            n_children = 1 + np.isin(mothers, twin.inds) - np.isin(mothers, i_death.inds) # Twins and infant deaths are subsets of live births
+
+            assert n_children.sum() == new_people
+            end_inds = len(all_ppl) + np.cumsum(n_children)
+            start_inds = end_inds - n_children
+            for mother, start_ind, end_ind in zip(mothers, start_inds, end_inds):
+                all_ppl.children[mother] += list(range(start_ind, end_ind))
 
         return
 
@@ -819,10 +807,10 @@ class People(fpb.BasePeople):
         modern_methods = sc.findinds(list(self.pars['methods']['modern'].values()))
         method_age = (self.pars['method_age'] <= self.age)
         fecund_age = self.age < self.pars['age_limit_fecundity']
-        denominator = method_age * fecund_age * self.is_female * (self.alive)
+        denominator = method_age & fecund_age & self.is_female & self.alive
         numerator = np.isin(self.method, modern_methods)
-        no_method_mcpr = np.sum((self.method == 0) * denominator)
-        on_method_mcpr = np.sum(numerator * denominator)
+        no_method_mcpr = np.count_nonzero((self.method == 0) & denominator)
+        on_method_mcpr = np.count_nonzero(numerator & denominator)
         self.step_results['no_methods_mcpr'] += no_method_mcpr
         self.step_results['on_methods_mcpr'] += on_method_mcpr
 
@@ -840,11 +828,11 @@ class People(fpb.BasePeople):
         Includes women using any method of contraception, including LAM
         Denominator of possible users includes all women aged 15-49
         """
-        denominator = ((self.pars['method_age'] <= self.age) * (self.age < self.pars['age_limit_fecundity']) * (
-                self.sex == 0) * (self.alive))
+        denominator = ((self.pars['method_age'] <= self.age) & (self.age < self.pars['age_limit_fecundity']) & (
+                self.sex == 0) & self.alive)
         numerator = self.method != 0
-        no_method_cpr = np.sum((self.method == 0) * denominator)
-        on_method_cpr = np.sum(numerator * denominator)
+        no_method_cpr = np.count_nonzero(~numerator & denominator)
+        on_method_cpr = np.count_nonzero(numerator & denominator)
         self.step_results['no_methods_cpr'] += no_method_cpr
         self.step_results['on_methods_cpr'] += on_method_cpr
 
@@ -862,11 +850,11 @@ class People(fpb.BasePeople):
         Denominator of possible users excludes pregnant women and those not sexually active in the last 4 weeks
         Used to compare new metrics of contraceptive prevalence and eventually unmet need to traditional mCPR definitions
         """
-        denominator = ((self.pars['method_age'] <= self.age) * (self.age < self.pars['age_limit_fecundity']) * (
-                self.sex == 0) * (self.pregnant == 0) * (self.sexually_active == 1) * (self.alive))
+        denominator = ((self.pars['method_age'] <= self.age) & (self.age < self.pars['age_limit_fecundity']) & (
+                self.sex == 0) & (self.pregnant == 0) & (self.sexually_active == 1) & self.alive)
         numerator = self.method != 0
-        no_method_cpr = np.sum((self.method == 0) * denominator)
-        on_method_cpr = np.sum(numerator * denominator)
+        no_method_cpr = np.count_nonzero(~numerator & denominator)
+        on_method_cpr = np.count_nonzero(numerator & denominator)
         self.step_results['no_methods_acpr'] += no_method_cpr
         self.step_results['on_methods_acpr'] += on_method_cpr
 
@@ -1011,13 +999,15 @@ class People(fpb.BasePeople):
         age_min = self.age >= fpd.min_age
         age_max = self.age < self.pars['age_limit_fecundity']
 
-        self.step_results['total_women_fecund'] = np.sum(self.is_female * age_min * age_max)
+        self.step_results['total_women_fecund'] = np.count_nonzero(self.is_female & age_min & age_max)
 
         # Age person at end of timestep after tabulating results
         alive_now.update_age()  # Important to keep this here so birth spacing gets recorded accurately
 
-        # Storing ages by method age group
-        age_bins = [0] + [max(fpd.age_specific_channel_bins[key]) for key in fpd.age_specific_channel_bins]
-        self.age_by_group = np.digitize(self.age, age_bins) - 1
+        # Storing ages by method age group; every reader is an age-specific result under track_as, so otherwise
+        # skip it and leave the state at its initial value, which nothing reads
+        if self.pars['track_as']:
+            age_bins = np.array([0] + [max(fpd.age_specific_channel_bins[key]) for key in fpd.age_specific_channel_bins])
+            self.age_by_group = np.searchsorted(age_bins, self.age, 'right') - 1
 
         return self.step_results
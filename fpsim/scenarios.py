@@ -2,6 +2,7 @@
 Class to define and run scenarios
 '''
 
+from collections import defaultdict
 import numpy as np
 import pandas as pd
 import sciris as sc
@@ -302,6 +303,9 @@ class Scenarios(sc.prettyobj):
         self.msims = []
         self.msim = None
         self.already_run = False
+        self._msim_merged = None
+        self._recompute = True
+        self.results = None
         return
 
 
@@ -320,11 +324,13 @@ class Scenarios(sc.prettyobj):
         if scenlabel is None:
             errormsg = 'Scenario label must be defined'
             raise ValueError(errormsg)
+        base_pars = sc.mergedicts(fpp.pars(self.pars.get('location')), self.pars, _copy=True)
+        base_pars.update(kwargs)
+        seeds = base_pars['seed'] + np.arange(self.repeats) # One consecutive seed per repeat
         sims = sc.autolist()
-        for i in range(self.repeats):
-            pars = sc.mergedicts(fpp.pars(self.pars.get('location')), self.pars, _copy=True)
-            pars.update(kwargs)
-            pars['seed'] += i
+        for seed in seeds:
+            pars = sc.dcp(base_pars)
+            pars['seed'] = int(seed)
             sim = fps.Sim(pars=pars)
             sim.scenlabel = scenlabel # Special label for scenarios objects
             if sim.label is None:
@@ -385,8 +391,18 @@ class Scenarios(sc.prettyobj):
         return
 
 
-    def run(self, recompute=True, *args, **kwargs):
-        ''' Actually run a list of sims '''
+    def run(self, recompute=True, analyze=True, *args, **kwargs):
+        '''
+        Actually run a list of sims
+
+        All sims across all scenarios are independent, so they are run together
+        in a single parallel pool rather than one scenario at a time.
+
+        Args:
+            recompute (bool): whether to recompute the statistics for each scenario when re-merging
+            analyze   (bool): whether to calculate the summary statistics for each scenario (see ``scens.analyze_sims()``)
+            kwargs (dict): passed to ``msim.run()``, e.g. ``parallel=False`` or ``n_cpus=4``
+        '''
 
         # Check that it's set up
         if not self.scens:
@@ -395,22 +411,36 @@ class Scenarios(sc.prettyobj):
         if not self.simslist:
             self.make_scens()
 
-        # Create msim
-        msims = sc.autolist()
+        # Create a single msim containing every scenario's sims, with chunks so it can be split by scenario later
+        all_sims = []
+        chunks = []
         for sims in self.simslist:
-            msims += fps.MultiSim(sims)
-        self.msim = fps.MultiSim.merge(*msims)
+            chunks.append(list(range(len(all_sims), len(all_sims)+len(sims))))
+            all_sims += sims
+        self.msim = fps.MultiSim(sims=all_sims, base_sim=sc.dcp(all_sims[0])) # multi_run() leaves the sims unrun, so the scenarios can be rerun
+        self.msim.chunks = chunks
 
         # Run
         self.msim.run(**kwargs)
         self.already_run = True
 
-        # Process
-        self.msim_merged =self.msim.remerge(recompute=recompute)
-        self.analyze_sims()
+        # Process; the merged msim is only created if it's needed, e.g. for plotting
+        self._msim_merged = None
+        self._recompute = recompute
+        self.results = None
+        if analyze:
+            self.analyze_sims()
         return
 
 
+    @property
+    def msim_merged(self):
+        ''' The msim with one (averaged) sim per scenario -- created the first time it's used '''
+        if getattr(self, '_msim_merged', None) is None and self.msim is not None:
+            self._msim_merged = self.msim.remerge(recompute=getattr(self, '_recompute', True))
+        return self._msim_merged
+
+
     def check_run(self):
         ''' Give a meaningful error message if the scenarios haven't been run '''
         if not self.already_run:
@@ -442,35 +472,25 @@ class Scenarios(sc.prettyobj):
         if start is None: start = sim0.pars['start_year']
         if end   is None: end   = sim0.pars['end_year']
 
-        def analyze_sim(sim):
-            def aggregate_channel(channel, is_sum=True, is_t=False):
-                if is_t:
-                    year = sim.results['t']
-                else:
-                    year = sim.results['tfr_years']
-                channel_results = sim.results[channel]
-                inds = sc.findinds((year >= start), year <= end)
-
-                if is_sum:
-                    return channel_results[inds].sum()
-                else:
-                    return channel_results[inds].mean()
-
-            # Defines how we calculate each channel, first number is is_sum: 1 = aggregate as sum, 0 = aggregate as mean
-            # The second parameter defines whether to aggregate by year or by timestep where 1 = use sim.t (timestep), 0 = use sim.tfr_years (years)
-            agg_param_dict = {'method_failures_over_year': (1, 0), 'pop_size': (1, 0), 'tfr_rates': (0, 0), 'maternal_deaths_over_year': (1, 0),
-                            'infant_deaths_over_year': (1, 0), 'mcpr': (0, 1), 'births': (1, 1)}
-            results_dict = {}
-
-            for channel in agg_param_dict:
-                parameters = agg_param_dict[channel]
-                results_dict[channel] = aggregate_channel(channel, parameters[0], parameters[1])
-
-            return results_dict
+        # Defines how we calculate each output: the result channel to use; whether to aggregate
+        # as a sum (otherwise as a mean); and whether to aggregate by timestep (results['t'])
+        # rather than by year (results['tfr_years'])
+        agg_channels = {
+            'births':          ('births',                    True,  True),
+            'fails':           ('method_failures_over_year', True,  False),
+            'popsize':         ('pop_size',                  True,  False),
+            'tfr':             ('tfr_rates',                 False, False),
+            'infant_deaths':   ('infant_deaths_over_year',   True,  False),
+            'maternal_deaths': ('maternal_deaths_over_year', True,  False),
+            'mcpr':            ('mcpr',                      False, True),
+        }
+
+        def year_slice(years):
+            ''' Years are sorted, so the (inclusive) range between start and end is contiguous '''
+            return slice(np.searchsorted(years, start, side='left'), np.searchsorted(years, end, side='right'))
 
         # Split the sims up by scenario
-        results = sc.objdict()
-        results.sims = sc.objdict(defaultdict=sc.autolist)
+        groups = defaultdict(list)
         for sim in self.msim.sims:
             try:
                 label = sim.scenlabel
@@ -478,33 +498,40 @@ class Scenarios(sc.prettyobj):
                 errormsg = f'Warning, could not extract scenlabel from sim {sim.label}; using default...'
                 print(errormsg)
                 label = sim.label
-            results.sims[label] += sim
-
-        # Count the births across the scenarios
-        raw = sc.ddict(list)
+            groups[label].append(sim)
+        results = sc.objdict()
+        results.sims = sc.objdict(groups)
+        n_sims = len(self.msim.sims)
+
+        # Aggregate each channel across the sims in each scenario, filling preallocated arrays
+        raw = {'scenario': np.empty(n_sims, dtype=object)}
+        for rawkey,(channel,is_sum,is_t) in agg_channels.items():
+            reduce = np.sum if is_sum else np.mean
+            dtype = reduce(sim0.results[channel][:1]).dtype # Keep the type the reduction gives, e.g. int for summed population sizes
+            raw[rawkey] = np.empty(n_sims, dtype=dtype)
+        i = 0
         for key,sims in results.sims.items():
-            for sim in sims:
-                results_dict = analyze_sim(sim)
-                raw['scenario'] += [key]      # Append scenario key
-                raw['births']   += [results_dict['births']] # Append births
-                raw['fails']    += [results_dict['method_failures_over_year']]  # Append failures
-                raw['popsize']  += [results_dict['pop_size']]    # Append population size
-                raw['tfr']      += [results_dict['tfr_rates']]    # Append mean tfr rates
-                raw['infant_deaths'] += [results_dict['infant_deaths_over_year']]
-                raw['maternal_deaths'] += [results_dict['maternal_deaths_over_year']]
-                raw['mcpr'] += [results_dict['mcpr']]
-
-
-        # Calculate basic stats
+            slices = [{True: year_slice(sim.results['t']), False: year_slice(sim.results['tfr_years'])} for sim in sims] # Only compute these once per sim
+            rows = slice(i, i+len(sims))
+            raw['scenario'][rows] = key
+            for rawkey,(channel,is_sum,is_t) in agg_channels.items():
+                reduce = np.sum if is_sum else np.mean
+                vals = (reduce(sim.results[channel][sl[is_t]]) for sim,sl in zip(sims, slices)) # Reduce each sim's slice view without copying it
+                raw[rawkey][rows] = np.fromiter(vals, dtype=raw[rawkey].dtype, count=len(sims))
+            i += len(sims)
+
+        # Calculate basic stats, computing each one across all outputs at once (as floats, since they share one table)
+        outkeys = list(agg_channels.keys())
+        statkeys = ['mean', 'median', 'std', 'min', 'max']
+        arr = np.vstack([raw[k] for k in outkeys]) # One row per output
+        statarr = np.vstack([getattr(np, statkey)(arr, axis=1) for statkey in statkeys]) # One row per stat
+        results.stats_df = pd.DataFrame(statarr, index=statkeys, columns=outkeys)
         results.stats = sc.objdict()
-        for statkey in ['mean', 'median', 'std', 'min', 'max']:
-            results.stats[statkey] = sc.objdict()
-            for k,vals in raw.items():
-                if k != 'scenario':
-                    results.stats[statkey][k] = getattr(np, statkey)(vals)
-
-        # Also save as pandas
-        results.df = pd.DataFrame(raw)
+        for statkey,statvals in zip(statkeys, statarr):
+            results.stats[statkey] = sc.objdict(zip(outkeys, statvals))
+
+        # Also save as pandas; the columns are already typed arrays, so don't copy or re-infer them
+        results.df = pd.DataFrame(raw, copy=False)
         self.results = results
 
         return
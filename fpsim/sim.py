@@ -189,7 +189,6 @@ class Sim(fpb.BaseSim):
         """
 
         methods = self['methods']  # Shorten methods
-        methods['adjusted'] = sc.dcp(methods['raw'])  # Avoids needing to copy this within loops later
 
         # Compute the trend in MCPR
         trend_years = methods['mcpr_years']
@@ -210,19 +209,25 @@ class Sim(fpb.BaseSim):
             trend_val = nearest_val
         norm_trend_val = trend_val / norm_val  # Normalize so the correction factor is 1 at the normalization year
 
-        # Update annual (non-postpartum) population and postpartum switching matrices for current year mCPR - stratified by age
-        for switchkey in ['annual', 'pp1to6']:
-            for matrix in methods['adjusted'][switchkey].values():
-                matrix[0, 0] /= norm_trend_val  # Takes into account mCPR during year of sim
-                for i in range(len(matrix)):
-                    denom = matrix[i, :].sum()
-                    if denom > 0:
-                        matrix[i, :] = matrix[i, :] / denom  # Normalize so probabilities add to 1
-
-        # Update postpartum initiation matrices for current year mCPR - stratified by age
-        for matrix in methods['adjusted']['pp0to1'].values():
-            matrix[0] /= norm_trend_val  # Takes into account mCPR during year of sim
-            matrix /= matrix.sum()
+        # Stack each set of age-stratified matrices into one contiguous array, which is also the copy
+        # of the raw values, so they can be updated together; the age keys then index views into it.
+        # The stacks are kept too, indexed by age group in the order of fpd.method_age_map
+        age_keys = fpd.method_age_map.keys()
+        adjusted = {}
+        stacked = {}
+        for switchkey, raw in methods['raw'].items():
+            stack = np.array([raw[key] for key in age_keys], dtype=np.float64)
+            if switchkey == 'pp0to1':  # Update postpartum initiation matrices for current year mCPR - stratified by age
+                stack[:, 0] /= norm_trend_val  # Takes into account mCPR during year of sim
+                stack /= stack.sum(axis=1, keepdims=True)
+            else:  # Update annual (non-postpartum) population and postpartum switching matrices for current year mCPR - stratified by age
+                stack[:, 0, 0] /= norm_trend_val  # Takes into account mCPR during year of sim
+                denom = stack.sum(axis=2, keepdims=True)
+                np.divide(stack, denom, out=stack, where=(denom > 0))  # Normalize so probabilities add to 1
+            adjusted[switchkey] = {k: stack[i] for i, k in enumerate(age_keys)}
+            stacked[switchkey] = stack
+        methods['adjusted'] = adjusted
+        methods['stacked'] = stacked
 
         return
 
@@ -589,28 +594,18 @@ class Sim(fpb.BaseSim):
         max_age = self['age_limit_fecundity']
 
         ppl = self.people
-        rows = []
-        for i in range(len(ppl)):
-            if ppl.alive[i] and ppl.sex[i] == 0 and min_age <= ppl.age[i] < max_age:
-                row = dict(
-                    Age=int(round(ppl.age[i])),
-                    PP0to5=None,
-                    PP6to11=None,
-                    PP12to23=None,
-                    NonPP=1 if not ppl.postpartum[i] else 0,
-                    Pregnant=1 if ppl.pregnant[i] else 0,
-                    Parity=ppl.parity[i],
-                )
-                if ppl.postpartum[i]:
-                    pp_dur = ppl.postpartum_dur[i]
-                    row['PP0to5'] = 1 if 0 <= pp_dur < 6 else 0
-                    row['PP6to11'] = 1 if 6 <= pp_dur < 12 else 0
-                    row['PP12to23'] = 1 if 12 <= pp_dur <= 24 else 0
-                rows.append(row)
-
-        pp = pd.DataFrame(rows, index=None,
-                          columns=['Age', 'PP0to5', 'PP6to11', 'PP12to23', 'NonPP', 'Pregnant', 'Parity'])
-        pp.fillna(0, inplace=True)
+        inds = sc.findinds(ppl.alive & (ppl.sex == 0) & (ppl.age >= min_age) & (ppl.age < max_age))
+        postpartum = ppl.postpartum[inds]
+        pp_dur = ppl.postpartum_dur[inds]
+        pp = pd.DataFrame(dict(
+            Age      = np.round(ppl.age[inds]).astype(int), # Rounds half to even, like round()
+            PP0to5   = (postpartum & (pp_dur >= 0)  & (pp_dur < 6)).astype(float),
+            PP6to11  = (postpartum & (pp_dur >= 6)  & (pp_dur < 12)).astype(float),
+            PP12to23 = (postpartum & (pp_dur >= 12) & (pp_dur <= 24)).astype(float),
+            NonPP    = (~postpartum).astype(int),
+            Pregnant = ppl.pregnant[inds].astype(int),
+            Parity   = ppl.parity[inds],
+        ))
         return pp
 
     def to_df(self, include_range=False):
@@ -632,10 +627,10 @@ class Sim(fpb.BaseSim):
                             blhkey = f'{reskey}_{blh}'
                         else:
                             blhkey = reskey
-                        raw_res[blhkey] += blhres.tolist()
+                        raw_res[blhkey] = blhres
             elif sc.isarray(res) and len(res) == self.npts:
-                raw_res[reskey] += res.tolist()
-        df = pd.DataFrame(raw_res)
+                raw_res[reskey] = res if res.ndim == 1 else res.tolist()
+        df = pd.DataFrame(raw_res)  # Build in one go from the arrays, without converting to lists
         self.df = df
         return df
 
@@ -917,16 +912,14 @@ class Sim(fpb.BaseSim):
         max_age = self['age_limit_fecundity']
 
         # filtering for women with appropriate characteristics
-        bool_list = ppl.alive * [sex == 0 for sex in ppl.sex] * [min_age <= age for age in ppl.age] * [age < max_age for
-                                                                                                       age in ppl.age]
-        filtered_methods = [method for index, method in enumerate(ppl.method) if bool_list[index]]
-
-        unique, counts = np.unique(filtered_methods, return_counts=True)
-        count_dict = dict(zip(unique, counts))
+        eligible = ppl.alive & (ppl.sex == 0) & (ppl.age >= min_age) & (ppl.age < max_age)
+        filtered_methods = ppl.method[eligible]
 
-        result = [0] * (len(self.pars['methods']['eff']))
-        for method in count_dict:
-            result[method] = count_dict[method] / len(filtered_methods)
+        n_methods = len(self.pars['methods']['eff'])
+        counts = np.bincount(filtered_methods, minlength=n_methods)
+        result = [0] * n_methods
+        for method in sc.findinds(counts):
+            result[method] = counts[method] / len(filtered_methods)
 
         return result
 
@@ -1009,7 +1002,13 @@ class MultiSim(sc.prettyobj):
             return 0
 
     def run(self, compute_stats=True, **kwargs):
-        """ Run all simulations in the MultiSim """
+        """
+        Run all simulations in the MultiSim
+
+        Args:
+            compute_stats (bool): whether to compute statistics across the sims after running
+            kwargs (dict): passed to ``multi_run()``, e.g. ``parallel``, ``n_cpus``, or ``serial``
+        """
         # Handle missing labels
         for s, sim in enumerate(sc.tolist(self.sims)):
             if sim.label is None:
@@ -1085,6 +1084,8 @@ class MultiSim(sc.prettyobj):
                     results[reskey].high = np.quantile(raw[reskey], q=quantiles['high'], axis=axis)
 
         self.results = results
+        if any(self.base_sim is sim for sim in self.sims):  # The base sim is one of the sims, so don't overwrite its own results
+            self.base_sim = base_sim
         self.base_sim.results = results  # Store here too, to enable plotting
 
         if return_raw:
@@ -1215,21 +1216,19 @@ class MultiSim(sc.prettyobj):
         if mean:
             df = self.base_sim.to_df()
         else:
-            raw_res = sc.odict(defaultdict=list)
+            raw_res = sc.odict(defaultdict=list)  # Collect the arrays for each column, then join them once
             for s, sim in enumerate(self.sims):
+                scale = len(sim.results['tfr_years']) if yearly else sim.npts
                 for reskey in sim.results.keys():
                     res = sim.results[reskey]
-                    if sc.isarray(res):
-                        if len(res) == sim.npts and not yearly:
-                            raw_res[reskey] += res.tolist()
-                        elif len(res) == len(sim.results['tfr_years']) and yearly:
-                            raw_res[reskey] += res.tolist()
-
-                scale = len(sim.results['tfr_years']) if yearly else sim.npts
-                raw_res['sim'] += [s] * scale
-                raw_res['sim_label'] += [sim.label] * scale
-
-            df = pd.DataFrame(raw_res)
+                    if sc.isarray(res) and len(res) == scale:
+                        if res.ndim > 1:  # e.g. method usage, stored as one list per row
+                            res = pd.Series(res.tolist(), dtype=object).to_numpy()
+                        raw_res[reskey].append(res)
+                raw_res['sim'].append(np.full(scale, s))
+                raw_res['sim_label'].append(np.full(scale, sim.label, dtype=object))
+
+            df = pd.DataFrame({k: np.concatenate(v) for k, v in raw_res.items()})
             self.df = df
         return df
 
@@ -1370,9 +1369,33 @@ def single_run(sim):
     return sim
 
 
-def multi_run(sims, **kwargs):
-    """ Run multiple sims in parallel; usually used via the MultiSim class, not directly """
-    sims = sc.parallelize(single_run, iterarg=sims, **kwargs)
+def multi_run(sims, parallel=True, n_cpus=None, **kwargs):
+    """
+    Run multiple sims in parallel; usually used via the MultiSim class, not directly
+
+    Each sim is independent (and has its own seed), so the sims are farmed out
+    to a process pool with one worker per CPU, capped at the number of sims.
+
+    Args:
+        sims     (list): the sims to run
+        parallel (bool): whether to run in parallel (otherwise, run in serial in this process)
+        n_cpus   (int):  the number of worker processes to use (default: all available CPUs); ``ncpus`` is accepted as an alias
+        kwargs   (dict): passed to ``sc.parallelize()``
+
+    The sims passed in are never modified: worker processes run pickled copies,
+    and the serial path runs copies too.
+    """
+    sims = sc.tolist(sims)
+    ncpus = kwargs.pop('ncpus', None) # Alias, as used by sc.parallelize()
+    if n_cpus is None:
+        n_cpus = ncpus
+    if n_cpus is None:
+        n_cpus = sc.cpu_count()
+    n_cpus = max(1, min(n_cpus, len(sims)))
+    if not parallel or n_cpus == 1 or kwargs.get('serial'): # No point spinning up a pool for a single worker
+        kwargs['serial'] = True
+        sims = sc.dcp(sims) # Run copies, as the worker processes would, so the caller's sims are left unrun
+    sims = sc.parallelize(single_run, iterarg=sims, ncpus=n_cpus, **kwargs)
     return sims
 
 
@@ -55,11 +55,11 @@ def get_debut_init_vals(ppl):
                                         'age': debut_age_dict['age'],
                                         'prob': debut_age_dict['prob']})
     debut_age_values = np.zeros(n, dtype=int)
-    for r in debut_age_by_region['region'].unique():
+    for r, region_df in debut_age_by_region.groupby('region', sort=False): # Split once instead of scanning the table per region
         # Find indices in region array
         f_inds = sc.findinds(ppl.region == r)
-        region_debut_ages = debut_age_by_region.loc[debut_age_by_region['region'] == r, 'age'].values
-        region_debut_probs = debut_age_by_region.loc[debut_age_by_region['region'] == r, 'prob'].values
+        region_debut_ages = region_df['age'].values
+        region_debut_probs = region_df['prob'].values
         debut_age_dist = region_debut_ages[fpu.n_multinomial(region_debut_probs, len(f_inds))]
         debut_age_values[f_inds] = debut_age_dist
 
@@ -72,13 +72,11 @@ def get_urban_init_vals(ppl, urban_prop=None):
     n = len(ppl)
     urban = np.ones(n, dtype=bool)
     region_dict = ppl.pars['region']
-    urban_by_region = pd.DataFrame({'region': region_dict['region'], 'urban': region_dict['urban']})
     # For each region defined in region.csv, assign a regional distribution of urban/rural population
-    for r in urban_by_region['region']:
+    for r, region_urban_prop in zip(region_dict['region'], region_dict['urban']):
         # Find indices in region array
         f_inds = sc.findinds(ppl.region==r)
-        region_urban_prop = urban_by_region.loc[urban_by_region['region']==r, 'urban'].values[0]
-        urban_values = np.random.choice([True, False], size=len(f_inds), p=[region_urban_prop, 1-region_urban_prop])
+        urban_values = fpu.n_binomial(region_urban_prop, len(f_inds))
         urban[f_inds] = urban_values
 
     return urban
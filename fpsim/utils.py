@@ -5,6 +5,7 @@ File for storing utilities and probability calculators needed to run FP model
 import numpy as np
 import sciris as sc
 import numba as nb
+from scipy.special import expit
 from . import defaults as fpd
 from . import version as fpv
 
@@ -14,7 +15,7 @@ __all__ = ['set_seed', 'bt', 'bc', 'rbt', 'mt', 'sample', 'match_ages']
 __all__ += ['DuplicateNameException']
 
 
-@nb.jit((nb.float64[:], nb.float64, nb.float64), cache=True, nopython=True)
+@nb.njit((nb.float64[:], nb.float64, nb.float64), cache=True)
 def match_ages(age, age_low, age_high):
     ''' Find ages between age low and age_high '''
     match_low  = (age >= age_low)
@@ -22,19 +23,17 @@ def match_ages(age, age_low, age_high):
     return match_low & match_high
 
 
-def set_seed(seed=None):
-    ''' Reset the random seed -- complicated because of Numba '''
-
-    @nb.njit
-    def set_seed_numba(seed):
-        return np.random.seed(seed)
+@nb.njit((nb.int64,), cache=True)
+def set_seed_numba(seed):
+    ''' Numba has its own random state, separate from NumPy's, so needs to be seeded separately '''
+    return np.random.seed(seed)
 
-    def set_seed_regular(seed):
-        return np.random.seed(seed)
 
+def set_seed(seed=None):
+    ''' Reset the random seed -- complicated because of Numba '''
     if seed is not None:
-        set_seed_numba(seed)
-        set_seed_regular(seed)
+        set_seed_numba(int(seed))
+        np.random.seed(seed)
     return
 
 
@@ -83,6 +82,42 @@ def n_multinomial(probs, n):
     return np.searchsorted(np.cumsum(probs), np.random.random(n))
 
 
+@nb.njit((nb.float64[:,:], nb.int64[:]), cache=True)
+def n_multinomial_rows(cdfs, rows):
+    '''
+    An array of multinomial trials, each with its own probabilities. Trials are drawn
+    in order, so this gives the same results as calling n_multinomial() on each run
+    of equal rows in turn.
+
+    Args:
+        cdfs (array): cumulative probabilities, one row per set of outcome probabilities
+        rows (array): which row of cdfs to use for each trial
+
+    Returns:
+        Array of integer outcomes
+    '''
+    n = len(rows)
+    outcomes = np.empty(n, dtype=np.int64)
+    for i in range(n):
+        outcomes[i] = np.searchsorted(cdfs[rows[i]], np.random.random())
+    return outcomes
+
+
+@nb.njit((nb.int64[:,:], nb.int64[:], nb.int64[:]), cache=True)
+def count_transitions(counts, old, new):
+    '''
+    Tally transitions between states (e.g. contraceptive methods) in place.
+
+    Args:
+        counts (array): square matrix of counts, incremented at [old, new] for each agent
+        old (array): each agent's state before the transition
+        new (array): each agent's state after the transition
+    '''
+    for i in range(len(old)):
+        counts[old[i], new[i]] += 1
+    return
+
+
 def n_binomial(prob, n):
     '''
     Perform multiple binomial (Bernolli) trials
@@ -279,14 +314,17 @@ def logistic_5p(x, a, b, c, d, e):
         evaluated at the input x values.
     '''
 
-    return d + ((a - d)/(1.0 + np.exp(b*(x-c)))**e)
+    # 1/(1 + exp(z)) = expit(-z), which does not overflow for large z
+    return d + (a - d)*expit(-b*(x-c))**e
 
 
 def logistic_5p_dfun(x, a, b, c, d, e):
     '''
     Derivative of the 5 paraemter logistic function, same parameters
     '''
-    return b*(a - d)*e*np.exp(b*(-c + x))*(1.0 + np.exp(b*(-c + x)))**(-1.0 - e)
+    z = b*(x - c)
+    # exp(z)*(1 + exp(z))**(-1-e) = expit(z)*expit(-z)**e, which stays finite for large |z|
+    return b*(a - d)*e*expit(z)*expit(-z)**e
 
 
 def sigmoid_product(x, a1, b1, a2, b2):
@@ -296,10 +334,8 @@ def sigmoid_product(x, a1, b1, a2, b2):
 
     Current form produces  0 <= f(x) <= 1
     '''
-    max_exp = 709
-    x1 = np.clip(a1 - b1*x, -max_exp, max_exp)
-    x2 = np.clip(a2 - b2*x, -max_exp, max_exp)
-    return (1.0 / (1.0 + np.exp(x1))) * (1.0 / (1.0 + np.exp(x2)))
+    # expit(-z) = 1/(1 + exp(z)) in a single pass, and does not overflow for large |z|
+    return expit(b1*x - a1) * expit(b2*x - a2)
 
 
 def gompertz(x, a, b, c):
@@ -2,6 +2,7 @@
 Run tests on the analyzers, including calibration.
 """
 
+import numpy as np
 import sciris as sc
 import fpsim as fp
 
@@ -63,6 +64,19 @@ def test_snapshot():
     assert pop1 > pop0, 'Expected population to grow'
     ok(f'Population grew ({pop1} > {pop0})')
 
+    # Check that a snapshot is not changed by later updates to the people
+    sim = fp.Sim(location='test').run()
+    ppl = sim.people
+    shot = ppl.copy_arrays()
+    orig_age = ppl.age.copy()
+    orig_children = [list(c) for c in ppl.children]
+    ppl.age += 1
+    ppl.children[0].append(-1)
+    assert np.array_equal(shot.age, orig_age), 'Snapshot ages changed with the people'
+    assert shot.children == orig_children, 'Snapshot children changed with the people'
+    assert shot.pars is ppl.pars, 'Snapshot parameters should be shared, not copied'
+    ok('Snapshot is independent of later changes to the people')
+
     return snap
 
 
@@ -77,6 +91,54 @@ def test_age_pyramids():
     return ap
 
 
+def test_education_recorder():
+    sc.heading('Testing education recorder...')
+
+    er = make_analyzer(fp.education_recorder())
+    n_females = [len(snap['age']) for snap in er.snapshots.values()]
+    for key in er.keys:
+        assert er.trajectories[key].shape == (len(er.time), er.max_agents), f'Trajectories for {key} have the wrong shape'
+    ages = er.trajectories['age']
+    assert not np.isnan(ages[-1, :n_females[-1]]).any(), 'Recorded agents should have ages'
+    assert np.isnan(ages[0, n_females[0]:]).all(), 'Agents not yet in the population should be NaN'
+    ok(f'Education recorder tracked up to {er.max_agents} agents')
+
+    return er
+
+
+def test_empowerment_recorder():
+    sc.heading('Testing empowerment recorder...')
+
+    bins = np.arange(0, 100, 5)
+    er = make_analyzer(fp.empowerment_recorder(bins=bins))
+    for key in er.keys:
+        assert er.data[key].shape == (len(bins)-1, er.data['age'].shape[1]), f'Data for {key} has the wrong shape'
+    props = er.data['partnered']
+    props = props[~np.isnan(props)]
+    assert len(props) and (props >= 0).all() and (props <= 1).all(), 'Proportions should be between 0 and 1'
+    ok('Empowerment recorder data have the expected shape and range')
+
+    # Each row holds the agents in the matching age bin, so rows are empty exactly where the age density is zero
+    assert np.array_equal(np.isnan(er.data['partnered']), er.data['age'] == 0), 'Rows should line up with the age bins'
+
+    # Record the final state again and check it against a direct calculation for each bin
+    sim = fp.Sim(location='test', n_agents=500, analyzers=fp.empowerment_recorder(bins=bins)).run()
+    er = sim.get_analyzer()
+    er.apply(sim)
+    ppl = sim.people
+    living_females = ppl.alive & ppl.is_female
+    for b in range(len(bins)-1):
+        in_bin = living_females & (ppl.age >= bins[b]) & (ppl.age < bins[b+1])
+        expected = ppl.urban[in_bin].mean() if in_bin.any() else np.nan
+        assert np.allclose(er.data['urban'][b, sim.i], expected, equal_nan=True), f'Proportion urban is wrong for bin {b}'
+    ok('Empowerment recorder rows match the age bins')
+
+    if do_plot:
+        er.plot()
+
+    return er
+
+
 if __name__ == '__main__':
 
     sc.options(backend=None) # Turn on interactive plots
@@ -84,3 +146,5 @@ if __name__ == '__main__':
         calib = test_calibration()
         snap  = test_snapshot()
         ap    = test_age_pyramids()
+        edu   = test_education_recorder()
+        er    = test_empowerment_recorder()
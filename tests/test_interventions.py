@@ -92,6 +92,25 @@ def test_change_par():
     return m
 
 
+def test_update_methods():
+    ''' Test that update_methods() validates on creation and leaves its inputs untouched '''
+    sc.heading('Testing update_methods()...')
+
+    probs = dict(source='None', dest='Injectables', factor=2.0, ages=['<18', '18-20'])
+    orig = sc.dcp(probs)
+    um = fp.update_methods(year=2005, probs=probs)
+    sim = make_sim(interventions=um).run()
+    assert um.applied, 'Intervention was not applied'
+    assert probs == orig, 'Method probability entry was modified'
+
+    with pytest.raises(ValueError): # Invalid keys are caught when the intervention is created
+        fp.update_methods(year=2005, probs=dict(source='None', dest='Injectables', factor=2.0, invalid_key=1))
+    with pytest.raises(ValueError): # Factor and value can't both be supplied
+        fp.update_methods(year=2005, probs=dict(source='None', dest='Injectables', factor=2.0, value=0.5))
+
+    return sim
+
+
 def test_plot():
     sc.heading('Testing intervention plotting...')
 
@@ -109,4 +128,5 @@ if __name__ == '__main__':
     with sc.timer():
         isim   = test_intervention_fn()
         cpmsim = test_change_par()
+        umsim  = test_update_methods()
         sim  = test_plot()
@@ -37,7 +37,45 @@ def test_multisim(do_plot=do_plot):
     return msim
 
 
+def test_multisim_run_args():
+    ''' Check that the run arguments are accepted and that the original sims are not modified '''
+    sc.heading('Testing multisim run arguments...')
+
+    sims = [fp.Sim(location='test', n_agents=500, seed=seed) for seed in range(2)]
+    msim = fp.MultiSim(sims)
+    msim.run(ncpus=2) # Alias for n_cpus
+    assert len(msim.sims) == 2
+
+    msim = fp.MultiSim(sims)
+    msim.run(serial=True)
+    assert all(sim.already_run for sim in msim.sims), 'Expecting the msim sims to have been run'
+    assert not any(sim.already_run for sim in sims), 'Expecting the original sims to be left unrun'
+
+    return msim
+
+
+def test_multisim_to_df():
+    ''' Check that computing stats does not overwrite the results of a sim that is also the base sim '''
+    sc.heading('Testing multisim to_df after computing stats...')
+
+    msim = fp.MultiSim([fp.Sim(location='test', n_agents=500, seed=seed) for seed in range(2)])
+    msim.run(serial=True)
+    df = msim.to_df()
+    assert len(df) == 2*msim.sims[0].npts
+
+    sims = [fp.Sim(location='test', n_agents=500, seed=seed).run() for seed in range(2)]
+    msim = fp.MultiSim(sims) # The first sim is used as the base sim
+    msim.compute_stats()
+    df = msim.to_df()
+    assert len(df) == 2*sims[0].npts
+    assert msim.base_sim is not sims[0], 'Expecting the base sim to be replaced rather than overwritten'
+
+    return msim
+
+
 if __name__ == '__main__':
     sc.options(backend=None) # Turn on interactive plots
     with sc.timer(): # Start timing
         msim = test_multisim()
+        msim2 = test_multisim_run_args()
+        msim3 = test_multisim_to_df()
@@ -158,6 +158,36 @@ def test_method_usage():
     
     return sim
 
+
+def test_track_switching():
+    '''Test that method switching events are tallied when tracking is on'''
+    sc.heading('Testing method switching tracking...')
+
+    # The compiled tally should match a plain loop over agents
+    n_methods = 10
+    old = np.random.randint(n_methods, size=1000)
+    new = np.random.randint(n_methods, size=1000)
+    expected = np.zeros((n_methods, n_methods), dtype=int)
+    for x, y in zip(old, new):
+        expected[x, y] += 1
+    counts = np.zeros((n_methods, n_methods), dtype=np.int64)
+    fp.utils.count_transitions(counts, old.astype(np.int64), new.astype(np.int64))
+    assert np.array_equal(counts, expected), 'Switching counts do not match the loop'
+    ok('Switching counts match the loop')
+
+    sim = fp.Sim(location='test', track_switching=True)
+    sim.run()
+    res = sim.results
+    for key in ['annual', 'postpartum']:
+        pp = '_pp' if key == 'postpartum' else ''
+        total = sum(res[f'switching_events_{key}'][i].sum() for i in res[f'switching_events_{key}'])
+        by_age = sum(res[f'switching_events{pp}_{age}'][i].sum() for age in fp.defaults.method_age_map for i in res[f'switching_events{pp}_{age}'])
+        assert total > 0, f'Expected some {key} switching events'
+        assert total == by_age, f'Total {key} switching events ({total}) do not match the sum by age ({by_age})'
+    ok('Switching events are tracked and sum across age groups')
+
+    return sim
+
 # Run all tests
 if __name__ == '__main__':
 
@@ -168,4 +198,5 @@ if __name__ == '__main__':
         df   = test_to_df()
         ppl  = test_plot_people()
         res  = test_samples()
-        method = test_method_usage()
\ No newline at end of file
+        method = test_method_usage()
+        switch = test_track_switching()
\ No newline at end of file
@@ -170,6 +170,16 @@ def test_matrix_methods():
     assert new_rate == pars_arr[0, orig_ind], 'Copied method has different initiation rate'
     ok(f'New method initiation rate is {new_rate:0.4f} as expected')
 
+    # Test scaling a switching probability across all age groups
+    p5 = pars.copy()
+    factor = 2.0
+    p5.update_method_prob(source='None', dest=orig_name, factor=factor, matrix='annual')
+    for k,arr in pars['methods']['raw']['annual'].items():
+        p5_arr = p5['methods']['raw']['annual'][k]
+        assert p5_arr[0, orig_ind] == factor*arr[0, orig_ind], f'Initiation rate for {k} was not scaled'
+        assert p5_arr[0, orig_ind+1] == arr[0, orig_ind+1], f'Other rates for {k} should not change'
+    ok(f'Initiation rate was scaled by {factor} for all age groups as expected')
+
     if do_plot:
         pl.figure()
         pl.subplot(2,1,1)
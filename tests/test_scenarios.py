@@ -295,6 +295,27 @@ def test_scenarios():
     for keys in [("tfr", "tfr_rates"), ("mcpr", "mcpr")]:
         compare_results(keys[0], keys[1], is_sum=False) 
 
+    # check that summed counts keep their type, e.g. population size stays an integer
+    assert scenario_df["popsize"].dtype == sim_results["pop_size"].dtype, f"Population size should be {sim_results['pop_size'].dtype}, not {scenario_df['popsize'].dtype}"
+
+    # check the stats table matches the stats dicts
+    stats = base_scenario.results.stats
+    stats_df = base_scenario.results.stats_df
+    for statkey in stats.keys():
+        for key,val in stats[statkey].items():
+            assert stats_df.loc[statkey, key] == val, f"Stats table {statkey} for {key} is {stats_df.loc[statkey, key]} but should be {val}"
+
+
+def test_scenarios_rerun():
+    ''' Check that running the scenarios does not modify their sims, so they can be run again '''
+    sc.heading('Testing rerunning scenarios...')
+    scens = fp.Scenarios(location='test', n_agents=500, scens=fp.make_scen(label='Baseline'), start_year=int_year)
+    scens.run(serial=True)
+    scens.run(serial=True)
+    assert len(scens.msim.sims) == 1
+    return scens
+
+
 if __name__ == '__main__':
 
     sc.options(backend=None) # Turn on interactive plots
@@ -302,3 +323,4 @@ if __name__ == '__main__':
         msim1  = test_update_methods_eff()
         msim2  = test_update_methods_probs()
         scenarios = test_scenarios() # returns a dict with schema {name: Scenarios}
+        scens3 = test_scenarios_rerun()